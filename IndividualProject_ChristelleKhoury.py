@@ -1,17 +1,40 @@
+import hashlib
+import hmac
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# --- Category orders and colour palettes (built once at import) ---
+EDU_ORDER = ('Some High School', 'High School/GED', 'Some College', 'College')
+BP_ORDER = ('Normal', 'Elevated', 'Hypertension Stage 1', 'Hypertension Stage 2')
+SMOKING_STATUS_ORDER = ('Current Smoker', 'Non-Smoker')
+INTENSITY_BINS = [0, 9, 19, 70]
+INTENSITY_LABELS = ('Light (1-9)', 'Moderate (10-19)', 'Heavy (20+)')
+
+CUSTOM_RED_PALETTE = ('#800020', '#993333', '#A64A4A', '#BFBFBF')
+GENDER_COLORS = {'Male': '#800020', 'Female': '#A64A4A'}
+SMOKING_COLORS = {'Current Smoker': '#800020', 'Non-Smoker': '#898989'}
+INTENSITY_COLORS = ('#BFBFBF', '#A64A4A', '#800020')
+BP_COLORS = ('#BFBFBF', '#A64A4A', '#993333', '#800020')
+RATE_HOVER = '%{x}: %{y:.1f}%<extra></extra>'  # hover label for the CHD-rate bars
 
 st.set_page_config(page_title="Framingham CHD Risk Dashboard", page_icon="❤️", layout="wide")
 
 st.title("❤️ Framingham Heart Study: CHD Risk Dashboard")
 
+# SHA-256 of the dashboard password, so the plaintext is not kept in the source
+PASSWORD_SHA256 = bytes.fromhex("024f32b80bd03b301770cfc3cb11e741141fd74e6861304bdf3010eef45aa111")
+
 def check_password():
     def password_entered():
-        if st.session_state["password"] == "CHD2025":
+        entered = hashlib.sha256(st.session_state["password"].encode()).digest()
+        if hmac.compare_digest(entered, PASSWORD_SHA256):
             st.session_state["password_correct"] = True
-            del st.session_state["password"]  # cleanup
+            st.session_state["password"] = ""  # cleanup: don't keep the plaintext around
         else:
             st.session_state["password_correct"] = False
 
@@ -33,16 +56,49 @@ if not check_password():
 
 @st.cache_data
 def load_data():
-    url = "https://raw.githubusercontent.com/ChristelleKh/MSBA382-IndividualProject/main/framingham_cleaned.csv"
-    df = pd.read_csv(url)
-    df['Smoking_Status'] = df['currentSmoker'].apply(lambda x: 'Current Smoker' if x == 1 else 'Non-Smoker')
-    education_map = {1.0: 'Some High School', 2.0: 'High School/GED', 3.0: 'Some College', 4.0: 'College'}
-    df['Education_Level'] = df['education'].map(education_map)
+    # Local Parquet copy of framingham_cleaned.csv, reading only the columns the dashboard uses
+    path = Path(__file__).parent / "framingham_cleaned.parquet"
+    columns = ['gender', 'age', 'currentSmoker', 'cigsPerDay', 'education', 'BMI', 'totChol', 'BP_Category', 'TenYearCHD']
+    df = pd.read_parquet(path, columns=columns, engine='pyarrow')
+    # Derived columns are built once here (and cached) instead of on every rerun
+    df['Smoking_Status'] = pd.Categorical(np.where(df['currentSmoker'].to_numpy() == 1, 'Current Smoker', 'Non-Smoker'),
+                                          categories=SMOKING_STATUS_ORDER)
+    df['Education_Level'] = pd.Categorical.from_codes(df['education'].astype('int8').to_numpy() - 1, categories=EDU_ORDER)
+    df['Smoking_Intensity'] = pd.cut(df['cigsPerDay'], bins=INTENSITY_BINS, labels=INTENSITY_LABELS, right=False)
+    # Source columns only needed to derive the categoricals above
+    df = df.drop(columns=['education', 'cigsPerDay'])
+
+    # Narrower dtypes: smaller cached frame and faster masks/groupbys
+    df[['age', 'currentSmoker', 'TenYearCHD']] = df[['age', 'currentSmoker', 'TenYearCHD']].astype('int8')
+    df[['BMI', 'totChol']] = df[['BMI', 'totChol']].astype('float32')
+    # Categories in first-seen file order, fixed before the age sort below; the gender
+    # filter options come from these same categories
+    df['gender'] = pd.Categorical(df['gender'], categories=pd.unique(df['gender']))
+    df['BP_Category'] = pd.Categorical(df['BP_Category'], categories=BP_ORDER, ordered=True)
+
+    # Rows sorted by age so any age range is one contiguous block of rows
+    order = np.argsort(df['age'].to_numpy(), kind='stable')
+    df = df.iloc[order].reset_index(drop=True)
 
     return df
 
 
-data = load_data()
+# Youngest and oldest age (first and last rows of the age-sorted data)
+@st.cache_data
+def load_age_bounds():
+    ages = load_data()['age'].to_numpy()
+    return int(ages[0]), int(ages[-1])
+
+
+# Gender filter options: the gender categories, in first-seen file order
+@st.cache_data
+def load_gender_options():
+    return tuple(load_data()['gender'].cat.categories)
+
+
+# Filter options come from small cached tuples, so a rerun doesn't load the frame
+gender_choices = load_gender_options()
+age_min, age_max = load_age_bounds()
 
 # --- Main Layout with Fixed Filter Panel  ---
 filters_col, plots_col = st.columns([1, 4])
@@ -50,119 +106,226 @@ filters_col, plots_col = st.columns([1, 4])
 with filters_col:
     st.subheader("Filter Data")
 
-    gender_options = st.multiselect("Select Gender:", options=data['gender'].unique(), default=data['gender'].unique())
-    age_min = int(data['age'].min())
-    age_max = int(data['age'].max())
+    gender_options = st.multiselect("Select Gender:", options=gender_choices, default=gender_choices)
     age_range = st.slider("Select Age Range:", min_value=age_min, max_value=age_max, value=(age_min, age_max))
 
     risk_factor = st.selectbox("Select Risk Factor:", ["Smoking", "Nutrition", "Blood Pressure"], index=0)
 
-filtered_data = data[
-    (data['gender'].isin(gender_options)) &
-    (data['age'].between(age_range[0], age_range[1]))
-]
-
-risk_data = filtered_data[filtered_data['TenYearCHD'] == 1]
-
 # --- Chart Generation (with reduced height for better fit) ---
 CHART_HEIGHT = 320
 
-# --- Always shown ---
-
-# Gender plot 
-chd_rate_gender = filtered_data.groupby('gender')['TenYearCHD'].mean().reset_index()
-chd_rate_gender['CHD_Risk_%'] = chd_rate_gender['TenYearCHD'] * 100
-fig_sex = px.bar(chd_rate_gender, x='gender', y='CHD_Risk_%', title="CHD Risk Rate by Gender",
-                 color='gender', color_discrete_map={'Male': '#800020', 'Female': '#A64A4A'})
-fig_sex.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, height=CHART_HEIGHT, showlegend=False, bargap=0.4)
-
 
-# Age distribution plot 
-fig_age = px.histogram(risk_data, x='age', marginal='box', title="Age Distribution of CHD Cases", color_discrete_sequence=['#800020'])
-fig_age.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, height=CHART_HEIGHT)
+# The filter is the contiguous block of rows for the age range plus a gender mask over
+# just that block. Charts slice a column by `rows` first, so work scales with the block.
+# The rows are age-sorted, so the block's ends are two binary searches on the caller's df.
+def filter_rows(df, gender_tuple, age_lo, age_hi):
+    ages = df['age'].to_numpy()
+    rows = slice(np.searchsorted(ages, age_lo, side='left'), np.searchsorted(ages, age_hi, side='right'))
+    gender = df['gender'].array
+    keep = np.isin(gender.codes[rows], gender.categories.get_indexer(list(gender_tuple)))
+    return rows, keep
+
+
+# Filtered values of a column (numpy array or categorical codes) for a filter_rows() selection
+def select(values, selection):
+    rows, keep = selection
+    return values[rows][keep]
+
+
+# Groupby-mean over integer category codes with np.bincount: per-group means and counts.
+# Rows with code -1 (no category) are skipped.
+def group_mean(codes, y, ng):
+    keep = codes >= 0
+    codes, y = codes[keep], y[keep]
+    s = np.bincount(codes, weights=y, minlength=ng)
+    c = np.bincount(codes, minlength=ng)
+    return s / np.maximum(c, 1), c
+
+
+# Mean of TenYearCHD per category over the selected rows, computed on the categorical codes
+# rather than with a pandas groupby. Returns (labels, rates) for the categories present,
+# in category order.
+def chd_rate_by(df, col, selection):
+    codes = select(df[col].array.codes, selection)
+    y = select(df['TenYearCHD'].to_numpy(), selection).astype(np.float32)
+    categories = df[col].cat.categories
+    means, counts = group_mean(codes, y, len(categories))
+    present = np.flatnonzero(counts)
+    return categories[present].tolist(), means[present]
+
+
+# Box plot from a server-side five-number summary: the box is drawn from precomputed
+# quartiles/whiskers and only the outliers (beyond 1.5 IQR) are sent as points.
+# orientation='h' lays the box along x; row/col place it in a subplot grid.
+def add_summary_box(fig, values, name, color, orientation='v', row=None, col=None):
+    values = values.astype(np.float64)
+    if not values.size:
+        return
+    q = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q[2] - q[0]
+    lo, hi = q[0] - 1.5 * iqr, q[2] + 1.5 * iqr
+    inside = values[(values >= lo) & (values <= hi)]
+    outliers = values[(values < lo) | (values > hi)]
+    position, points = ('y', 'x') if orientation == 'h' else ('x', 'y')
+    fig.add_trace(go.Box(q1=[q[0]], median=[q[1]], q3=[q[2]], lowerfence=[inside.min()], upperfence=[inside.max()],
+                         orientation=orientation, name=name, marker_color=color, **{position: [name]}), row=row, col=col)
+    if outliers.size:
+        fig.add_trace(go.Scatter(mode='markers', name=name, marker_color=color,
+                                 **{position: [name] * outliers.size, points: outliers}), row=row, col=col)
+
+
+# Each chart builder below is cached on the filter values, so switching the risk factor
+# (or returning to a previous filter combination) reuses the already-built figures.
+# The builders use st.cache_resource: a hit hands back the stored figure object as-is
+# instead of unpickling a fresh copy. The figures are never modified after being built.
 
+# --- Always shown ---
 
-# Education plot 
-CUSTOM_RED_PALETTE = ['#800020', '#993333', '#A64A4A', '#BFBFBF']
-chd_rate_edu = filtered_data.groupby('Education_Level')['TenYearCHD'].mean().reset_index()
-chd_rate_edu['CHD_Risk_%'] = chd_rate_edu['TenYearCHD'] * 100
-edu_order = ['Some High School', 'High School/GED', 'Some College', 'College']
-# Create color map based on risk
-sorted_by_risk = chd_rate_edu.sort_values('CHD_Risk_%', ascending=False)
-color_map_edu = {cat: color for cat, color in zip(sorted_by_risk['Education_Level'], CUSTOM_RED_PALETTE)}
-# Sort back for plotting
-chd_rate_edu['Education_Level'] = pd.Categorical(chd_rate_edu['Education_Level'], categories=edu_order, ordered=True)
-chd_rate_edu = chd_rate_edu.sort_values('Education_Level')
-fig_edu = px.bar(chd_rate_edu, x='Education_Level', y='CHD_Risk_%', title='CHD Risk Rate by Education',
-                 color='Education_Level', color_discrete_map=color_map_edu)
-fig_edu.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+# The three demographic charts share one figure (and one layout/template) as a 1x3 grid;
+# the age column is split into a box row above a histogram row.
+@st.cache_resource
+def compute_top_fig(gender_tuple, age_lo, age_hi):
+    df = load_data()
+    selection = filter_rows(df, gender_tuple, age_lo, age_hi)
+    fig_top = make_subplots(rows=2, cols=3, shared_xaxes=True, row_heights=[0.2, 0.8], vertical_spacing=0.02, horizontal_spacing=0.06,
+                            specs=[[{'rowspan': 2}, {}, {'rowspan': 2}], [None, {}, None]],
+                            subplot_titles=("CHD Risk Rate by Gender", "Age Distribution of CHD Cases", "CHD Risk Rate by Education"))
+
+    # Gender plot 
+    gender_labels, gender_rates = chd_rate_by(df, 'gender', selection)
+    fig_top.add_trace(go.Bar(x=gender_labels, y=gender_rates * 100, marker_color=[GENDER_COLORS[g] for g in gender_labels],
+                             width=0.6, hovertemplate=RATE_HOVER), row=1, col=1)
+
+    # Age distribution plot 
+    chd_pos = select(df['TenYearCHD'].to_numpy(), selection) == 1
+    ages = select(df['age'].to_numpy(), selection)[chd_pos].astype(np.int16)
+    # Bin the ages and summarise the box here so only per-bin counts and five numbers
+    # are sent to the browser, not every CHD case. The rows are age-sorted, so each
+    # age is a contiguous run and its count is the gap between run starts.
+    if ages.size:
+        edges = np.arange(ages[0], ages[-1] + 2)
+        counts = np.diff(np.searchsorted(ages, edges))
+        add_summary_box(fig_top, ages, 'age', '#800020', orientation='h', row=1, col=2)
+        fig_top.add_trace(go.Bar(x=edges[:-1], y=counts, marker_color='#800020', width=1,
+                                 hovertemplate='age %{x}: %{y} CHD cases<extra></extra>'), row=2, col=2)
+    fig_top.update_yaxes(showticklabels=False, row=1, col=2)
+    fig_top.update_xaxes(title_text='age', row=2, col=2)
+
+    # Education plot 
+    # Labels come back in education order already
+    edu_labels, edu_rates = chd_rate_by(df, 'Education_Level', selection)
+    # Colour by risk rank: highest rate gets the darkest red
+    risk_rank = np.argsort(np.argsort(-edu_rates, kind='stable'), kind='stable')
+    fig_top.add_trace(go.Bar(x=edu_labels, y=edu_rates * 100, marker_color=[CUSTOM_RED_PALETTE[r] for r in risk_rank],
+                             hovertemplate=RATE_HOVER), row=1, col=3)
+
+    fig_top.update_xaxes(showgrid=False)
+    fig_top.update_yaxes(showgrid=False)
+    fig_top.update_layout(showlegend=False, height=CHART_HEIGHT)
+    return fig_top
 
 
 # Smoking
-chd_rate_smoke = filtered_data.groupby('Smoking_Status')['TenYearCHD'].mean().reset_index()
-chd_rate_smoke['CHD_Risk_%'] = chd_rate_smoke['TenYearCHD'] * 100
-fig_smoke = px.bar(chd_rate_smoke, x='Smoking_Status', y='CHD_Risk_%', title="CHD Risk by Smoking Status", color='Smoking_Status', color_discrete_map={'Current Smoker': '#800020', 'Non-Smoker': '#898989'})
-fig_smoke.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, xaxis_title=None, height=CHART_HEIGHT)
-
-smokers_df = filtered_data[filtered_data['currentSmoker'] == 1].copy()
-bins = [0, 9, 19, 70]
-labels = ['Light (1-9)', 'Moderate (10-19)', 'Heavy (20+)']
-smokers_df['Smoking_Intensity'] = pd.cut(smokers_df['cigsPerDay'], bins=bins, labels=labels, right=False)
-chd_rate_intensity = smokers_df.groupby('Smoking_Intensity')['TenYearCHD'].mean().reset_index()
-chd_rate_intensity['CHD_Risk_%'] = chd_rate_intensity['TenYearCHD'] * 100
-fig_intensity = px.bar(chd_rate_intensity, x='Smoking_Intensity', y='CHD_Risk_%', title="CHD Risk by Smoking Intensity", color='Smoking_Intensity', color_discrete_sequence=['#BFBFBF', '#A64A4A', '#800020'])
-fig_intensity.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+@st.cache_resource
+def compute_smoking_figs(gender_tuple, age_lo, age_hi):
+    df = load_data()
+    selection = filter_rows(df, gender_tuple, age_lo, age_hi)
+    smoke_labels, smoke_rates = chd_rate_by(df, 'Smoking_Status', selection)
+    fig_smoke = go.Figure(go.Bar(x=smoke_labels, y=smoke_rates * 100, marker_color=[SMOKING_COLORS[s] for s in smoke_labels],
+                                 hovertemplate=RATE_HOVER))
+    fig_smoke.update_layout(title="CHD Risk by Smoking Status", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, xaxis_title=None, height=CHART_HEIGHT)
+
+    rows, keep = selection
+    smokers = (rows, keep & (df['currentSmoker'].to_numpy()[rows] == 1))
+    intensity_labels, intensity_rates = chd_rate_by(df, 'Smoking_Intensity', smokers)
+    fig_intensity = go.Figure(go.Bar(x=intensity_labels, y=intensity_rates * 100, marker_color=INTENSITY_COLORS[:len(intensity_labels)],
+                                     hovertemplate=RATE_HOVER))
+    fig_intensity.update_layout(title="CHD Risk by Smoking Intensity", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+    return fig_smoke, fig_intensity
+
 
 # Physical Health
-fig_bmi = go.Figure()
-fig_bmi.add_trace(go.Box(y=filtered_data[filtered_data['TenYearCHD'] == 0]['BMI'], name='No CHD', marker_color='#898989'))
-fig_bmi.add_trace(go.Box(y=filtered_data[filtered_data['TenYearCHD'] == 1]['BMI'], name='CHD Risk', marker_color='#800020'))
-fig_bmi.update_layout(title="BMI by CHD Status", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+@st.cache_resource
+def compute_bodyweight_figs(gender_tuple, age_lo, age_hi):
+    df = load_data()
+    selection = filter_rows(df, gender_tuple, age_lo, age_hi)
+    # Row indices of each CHD group, computed once and shared by the BMI and cholesterol charts
+    chd_pos = select(df['TenYearCHD'].to_numpy(), selection) == 1
+    no_chd_rows = np.flatnonzero(~chd_pos)
+    chd_rows = np.flatnonzero(chd_pos)
+    bmi = select(df['BMI'].to_numpy(), selection)
+    fig_bmi = go.Figure()
+    add_summary_box(fig_bmi, bmi[no_chd_rows], 'No CHD', '#898989')
+    add_summary_box(fig_bmi, bmi[chd_rows], 'CHD Risk', '#800020')
+    fig_bmi.update_layout(title="BMI by CHD Status", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+
+    fig_chol = go.Figure()
+    chol = select(df['totChol'].to_numpy(), selection)
+    add_summary_box(fig_chol, chol[no_chd_rows], 'No CHD', '#898989')
+    add_summary_box(fig_chol, chol[chd_rows], 'CHD Risk', '#800020')
+    fig_chol.update_layout(title="Cholesterol by CHD Status", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+    return fig_bmi, fig_chol
 
-fig_chol = go.Figure()
-fig_chol.add_trace(go.Box(y=filtered_data[filtered_data['TenYearCHD'] == 0]['totChol'], name='No CHD', marker_color='#898989'))
-fig_chol.add_trace(go.Box(y=filtered_data[filtered_data['TenYearCHD'] == 1]['totChol'], name='CHD Risk', marker_color='#800020'))
-fig_chol.update_layout(title="Cholesterol by CHD Status", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, showlegend=False, height=CHART_HEIGHT)
 
 # BP
-chd_rate_bp = filtered_data.groupby('BP_Category')['TenYearCHD'].mean().reset_index()
-chd_rate_bp['CHD_Risk_%'] = chd_rate_bp['TenYearCHD'] * 100
-bp_order = ['Normal', 'Elevated', 'Hypertension Stage 1', 'Hypertension Stage 2']
-chd_rate_bp['BP_Category'] = pd.Categorical(chd_rate_bp['BP_Category'], categories=bp_order, ordered=True)
-chd_rate_bp = chd_rate_bp.sort_values('BP_Category')
-fig_bp = px.bar(chd_rate_bp, x='BP_Category', y='CHD_Risk_%', title="CHD Risk by Blood Pressure Category", color='BP_Category', color_discrete_sequence=['#BFBFBF', '#A64A4A', '#993333', '#800020'])
-fig_bp.update_layout(xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+@st.cache_resource
+def compute_bp_fig(gender_tuple, age_lo, age_hi):
+    df = load_data()
+    selection = filter_rows(df, gender_tuple, age_lo, age_hi)
+    # Labels come back in blood pressure order already
+    bp_labels, bp_rates = chd_rate_by(df, 'BP_Category', selection)
+    fig_bp = go.Figure(go.Bar(x=bp_labels, y=bp_rates * 100, marker_color=BP_COLORS[:len(bp_labels)],
+                              hovertemplate=RATE_HOVER))
+    fig_bp.update_layout(title="CHD Risk by Blood Pressure Category", xaxis_showgrid=False, yaxis_showgrid=False, yaxis_title=None, xaxis_title=None, showlegend=False, height=CHART_HEIGHT)
+    return fig_bp
+
+
+# Figure for the top row plus the selected risk factor's charts
+def build_all_figures(gender_tuple, age_lo, age_hi, risk_factor):
+    figs = {'top': compute_top_fig(gender_tuple, age_lo, age_hi)}
+    if risk_factor == "Smoking":
+        figs['smoke'], figs['intensity'] = compute_smoking_figs(gender_tuple, age_lo, age_hi)
+    elif risk_factor == "Nutrition":
+        figs['bmi'], figs['chol'] = compute_bodyweight_figs(gender_tuple, age_lo, age_hi)
+    elif risk_factor == "Blood Pressure":
+        figs['bp'] = compute_bp_fig(gender_tuple, age_lo, age_hi)
+    return figs
+
+
+# Reruns with unchanged filters (e.g. focus changes) reuse this session's figures directly
+filter_key = (tuple(sorted(gender_options)), age_range[0], age_range[1])
+fingerprint = (filter_key, risk_factor)
+if st.session_state.get("fig_fingerprint") == fingerprint:
+    figs = st.session_state["figs"]
+else:
+    figs = build_all_figures(*filter_key, risk_factor)
+    st.session_state["fig_fingerprint"] = fingerprint
+    st.session_state["figs"] = figs
 
 
 # Dashboard Layout
 with plots_col:
     # Top row: always demographics
-    r1c1, r1c2, r1c3 = st.columns(3)
-    with r1c1:
-        st.plotly_chart(fig_sex, use_container_width=True)
-    with r1c2:
-        st.plotly_chart(fig_age, use_container_width=True)
-    with r1c3:
-        st.plotly_chart(fig_edu, use_container_width=True)
+    st.plotly_chart(figs['top'], use_container_width=True)
 
 
     # Bottom row: only selected risk factor
     if risk_factor == "Smoking":
         r2c1, r2c2 = st.columns(2)
         with r2c1:
-            st.plotly_chart(fig_smoke, use_container_width=True)
+            st.plotly_chart(figs['smoke'], use_container_width=True)
         with r2c2:
-            st.plotly_chart(fig_intensity, use_container_width=True)
+            st.plotly_chart(figs['intensity'], use_container_width=True)
 
     elif risk_factor == "Nutrition":
         r2c1, r2c2 = st.columns(2)
         with r2c1:
-            st.plotly_chart(fig_bmi, use_container_width=True)
+            st.plotly_chart(figs['bmi'], use_container_width=True)
         with r2c2:
-            st.plotly_chart(fig_chol, use_container_width=True)
+            st.plotly_chart(figs['chol'], use_container_width=True)
 
     elif risk_factor == "Blood Pressure":
-        st.plotly_chart(fig_bp, use_container_width=True)
+        st.plotly_chart(figs['bp'], use_container_width=True)
 
 
 